@@ -18,19 +18,114 @@ import os
 import random
 import json
 import shutil
-from typing import List, Optional
+import sys
+from array import array
+from bisect import insort
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+try:
+    import orjson  # Encodeur JSON en C, bien plus rapide que le module json
+except ImportError:
+    orjson = None
+
+
+def _copier_lecture_ecriture(source: str, destination: str) -> None:
+    """
+    Copie de dernier recours en espace utilisateur : readinto dans un
+    tampon préalloué de 1 Mio (moins d'itérations et pas d'allocation
+    d'octets à chaque tour, contrairement à read/write par blocs de
+    64 Kio du module shutil).
+    """
+    tampon = bytearray(1 << 20)
+    vue = memoryview(tampon)
+    with open(source, "rb") as f_source, open(destination, "wb") as f_destination:
+        while True:
+            lus = f_source.readinto(tampon)
+            if not lus:
+                break
+            f_destination.write(vue[:lus])
+
+
+def _copier_fichier(source: str, destination: str) -> None:
+    """
+    Copie un fichier sans faire transiter les octets par l'espace
+    utilisateur : copy_file_range (copie en espace noyau, éventuellement
+    reflink O(1) sur les systèmes CoW), puis sendfile, puis une boucle
+    readinto en dernier recours. Les métadonnées ne sont pas copiées,
+    les images de cartes n'en ont pas besoin.
+    """
+    fd_source = os.open(source, os.O_RDONLY)
+    try:
+        fd_destination = os.open(
+            destination, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644
+        )
+        try:
+            if hasattr(os, "copy_file_range"):
+                try:
+                    while os.copy_file_range(fd_source, fd_destination, 1 << 30):
+                        pass
+                    return
+                except OSError:
+                    os.lseek(fd_source, 0, os.SEEK_SET)
+                    os.lseek(fd_destination, 0, os.SEEK_SET)
+                    os.ftruncate(fd_destination, 0)
+
+            if hasattr(os, "sendfile"):
+                try:
+                    taille = os.fstat(fd_source).st_size
+                    position = 0
+                    while position < taille:
+                        envoye = os.sendfile(
+                            fd_destination, fd_source, position, taille - position
+                        )
+                        if envoye == 0:
+                            break
+                        position += envoye
+                    return
+                except OSError:
+                    os.lseek(fd_source, 0, os.SEEK_SET)
+                    os.lseek(fd_destination, 0, os.SEEK_SET)
+                    os.ftruncate(fd_destination, 0)
+        finally:
+            os.close(fd_destination)
+    finally:
+        os.close(fd_source)
+
+    # Aucun appel système de copie disponible : copie en espace utilisateur
+    _copier_lecture_ecriture(source, destination)
+
+
+def _melanger_lemire(liste, rng: random.Random) -> None:
+    """
+    Mélange de Fisher-Yates (variante Durstenfeld) en place, sur
+    n'importe quelle séquence mutable (liste ou array).
+
+    Les indices bornés sont tirés par la méthode de Lemire : un mot de
+    64 bits et une multiplication par échange ((mot * n) >> 64), sans
+    division ni boucle de rejet comme dans random.shuffle.
+    """
+    getrandbits = rng.getrandbits
+    for i in range(len(liste) - 1, 0, -1):
+        j = (getrandbits(64) * (i + 1)) >> 64
+        liste[i], liste[j] = liste[j], liste[i]
 
 
 class Carte:
     """Représente une carte individuelle"""
 
-    def __init__(self, numero: int, nom_fichier: str):
+    __slots__ = ("numero", "nom_fichier", "chemin", "_str")
+
+    def __init__(self, numero: int, nom_fichier: str, chemin: Optional[str] = None):
         self.numero = numero
         self.nom_fichier = nom_fichier
-        self.chemin = None
+        self.chemin = chemin
+        # Le numéro est immuable : formater une fois pour toutes plutôt
+        # qu'à chaque affichage de la main
+        self._str = f"Carte {numero}"
 
     def __str__(self):
-        return f"Carte {self.numero}"
+        return self._str
 
     def __repr__(self):
         return f"Carte({self.numero}, '{self.nom_fichier}')"
@@ -46,41 +141,70 @@ class GestionnaireCartes:
         self.dossier_pioche = "pioche"
 
         self.toutes_cartes: List[Carte] = []
-        self.pioche: List[Carte] = []
-        self.main_joueur: List[Carte] = []
-        self.defausse: List[Carte] = []
+
+        # Les piles ne stockent que les numéros (1..54) dans des tableaux
+        # d'octets contigus ; les objets Carte sont retrouvés à la demande
+        # via l'index _carte_par_numero
+        self.pioche: array = array("B")
+        self.main_joueur: array = array("B")
+        self.defausse: array = array("B")
         self.seed_melange: Optional[int] = None
 
+        # Index numéro -> Carte pour retrouver une carte en O(1)
+        self._carte_par_numero: Dict[int, Carte] = {}
+
+        # Les actions marquent l'état "à synchroniser" au lieu de
+        # réorganiser les dossiers immédiatement ; la synchronisation se
+        # fait une seule fois avant le prochain affichage du menu
+        self._a_synchroniser = False
+
     def creer_dossiers_jeu(self) -> None:
         """Crée les dossiers pour organiser les cartes"""
         dossiers = [self.dossier_main, self.dossier_defausse, self.dossier_pioche]
 
         for dossier in dossiers:
-            if os.path.exists(dossier):
-                shutil.rmtree(dossier)
-            os.makedirs(dossier)
+            shutil.rmtree(dossier, ignore_errors=True)
+            os.makedirs(dossier, exist_ok=True)
 
         print("📁 Dossiers de jeu créés : main, défausse, pioche")
 
-    def copier_carte_vers_dossier(self, carte: Carte, dossier_destination: str) -> bool:
+    def copier_carte_vers_dossier(self, numero: int, dossier_destination: str) -> bool:
         """
         Copie une carte vers un dossier spécifique
 
+        Les images sont des références en lecture seule : un lien physique
+        suffit (opération O(1) sans dupliquer les octets). On ne retombe sur
+        une vraie copie que si le système de fichiers refuse le lien.
+
         Args:
-            carte: La carte à copier
+            numero: Le numéro de la carte à copier
             dossier_destination: Le dossier de destination
 
         Returns:
             bool: True si la copie s'est bien passée
         """
+        carte = self.trouver_carte(numero)
+
         if not carte.chemin or not os.path.exists(carte.chemin):
             print(f"⚠️  Fichier source introuvable pour {carte}")
             return False
 
         chemin_destination = os.path.join(dossier_destination, carte.nom_fichier)
 
+        # Supprimer une éventuelle destination existante avant de lier
+        try:
+            os.remove(chemin_destination)
+        except OSError:
+            pass
+
         try:
-            shutil.copy2(carte.chemin, chemin_destination)
+            os.link(carte.chemin, chemin_destination)
+            return True
+        except OSError:
+            pass  # Lien impossible (autre volume, droits...) : copie classique
+
+        try:
+            _copier_fichier(carte.chemin, chemin_destination)
             return True
         except Exception as e:
             print(f"❌ Erreur lors de la copie de {carte} : {e}")
@@ -90,29 +214,66 @@ class GestionnaireCartes:
         """Organise toutes les cartes dans leurs dossiers respectifs"""
         print("🗂️  Organisation des cartes dans les dossiers...")
 
-        # Vider les dossiers
-        for dossier in [self.dossier_main, self.dossier_defausse, self.dossier_pioche]:
-            if os.path.exists(dossier):
-                for fichier in os.listdir(dossier):
-                    os.remove(os.path.join(dossier, fichier))
-
-        # Copier les cartes de la pioche
-        for carte in self.pioche:
-            self.copier_carte_vers_dossier(carte, self.dossier_pioche)
-
-        # Copier les cartes de la main
-        for carte in self.main_joueur:
-            self.copier_carte_vers_dossier(carte, self.dossier_main)
-
-        # Copier les cartes de la défausse
-        for carte in self.defausse:
-            self.copier_carte_vers_dossier(carte, self.dossier_defausse)
+        # Ne déplacer que la différence entre l'état sur disque et l'état
+        # du jeu : une action utilisateur ne déplace que 1-2 cartes, inutile
+        # de recopier les 54 fichiers à chaque fois
+        piles = [
+            (self.dossier_pioche, self.pioche),
+            (self.dossier_main, self.main_joueur),
+            (self.dossier_defausse, self.defausse),
+        ]
+
+        a_copier = []
+
+        for dossier, numeros in piles:
+            noms_cibles = {f"{numero}.png" for numero in numeros}
+            presents = set()
+
+            # En une seule passe scandir : retirer les fichiers qui ne
+            # sont plus dans cette pile et relever ceux déjà en place
+            # (une lecture du dossier, pas de stat supplémentaire par
+            # fichier, et l'état réel du disque fait foi)
+            try:
+                with os.scandir(dossier) as entrees:
+                    for entree in entrees:
+                        if entree.name in noms_cibles:
+                            presents.add(entree.name)
+                        else:
+                            os.unlink(entree.path)
+            except FileNotFoundError:
+                os.makedirs(dossier, exist_ok=True)
+
+            # Noter les cartes manquantes dans ce dossier
+            a_copier.extend(
+                (numero, dossier)
+                for numero in numeros
+                if f"{numero}.png" not in presents
+            )
 
-        print(f"  ✅ {len(self.pioche)} cartes copiées dans '{self.dossier_pioche}'")
-        print(f"  ✅ {len(self.main_joueur)} cartes copiées dans '{self.dossier_main}'")
-        print(
-            f"  ✅ {len(self.defausse)} cartes copiées dans '{self.dossier_defausse}'"
-        )
+        # Les gros lots (première organisation : 54 fichiers) profitent de
+        # copies parallèles ; les actions courantes (1-2 cartes) restent
+        # séquentielles, le pool coûterait plus cher que les liens
+        if len(a_copier) > 8:
+            with ThreadPoolExecutor(max_workers=8) as executeur:
+                list(
+                    executeur.map(
+                        lambda job: self.copier_carte_vers_dossier(*job), a_copier
+                    )
+                )
+        else:
+            for numero, dossier in a_copier:
+                self.copier_carte_vers_dossier(numero, dossier)
+
+        self._a_synchroniser = False
+
+        print(f"  ✅ {len(self.pioche)} cartes dans '{self.dossier_pioche}'")
+        print(f"  ✅ {len(self.main_joueur)} cartes dans '{self.dossier_main}'")
+        print(f"  ✅ {len(self.defausse)} cartes dans '{self.dossier_defausse}'")
+
+    def _synchroniser_si_necessaire(self) -> None:
+        """Réorganise les dossiers uniquement si une action a modifié l'état"""
+        if self._a_synchroniser:
+            self.organiser_cartes_dans_dossiers()
 
     def charger_cartes(self) -> bool:
         """
@@ -130,19 +291,23 @@ class GestionnaireCartes:
 
         cartes_trouvees = []
 
+        # Une seule lecture du dossier suffit pour connaître tous les
+        # fichiers présents, au lieu d'un os.path.exists (stat) par carte
+        with os.scandir(self.dossier_cartes) as entrees:
+            presents = {entree.name: entree.path for entree in entrees if entree.is_file()}
+
         # Chercher les cartes numérotées de 1 à 54
         for numero in range(1, 55):
             nom_fichier = f"{numero}.png"
-            chemin_complet = os.path.join(self.dossier_cartes, nom_fichier)
+            chemin_complet = presents.get(nom_fichier)
 
-            if os.path.exists(chemin_complet):
-                carte = Carte(numero, nom_fichier)
-                carte.chemin = chemin_complet
-                cartes_trouvees.append(carte)
+            if chemin_complet is not None:
+                cartes_trouvees.append(Carte(numero, nom_fichier, chemin_complet))
             else:
                 print(f"⚠️  Carte {numero} manquante : {nom_fichier}")
 
         self.toutes_cartes = cartes_trouvees
+        self._carte_par_numero = {carte.numero: carte for carte in cartes_trouvees}
         print(f"✅ {len(self.toutes_cartes)} cartes chargées sur 54 attendues")
 
         if len(self.toutes_cartes) == 0:
@@ -168,18 +333,62 @@ class GestionnaireCartes:
 
         self.seed_melange = seed
 
-        # Copier toutes les cartes dans la pioche
-        self.pioche = self.toutes_cartes.copy()
+        # Remettre tous les numéros dans la pioche et mélanger en place
+        # (le mélange n'opère que sur un tampon de ~54 octets)
+        numeros = array("B", (carte.numero for carte in self.toutes_cartes))
+        _melanger_lemire(numeros, random.Random(seed))
+        self.pioche = numeros
+
+        print(f"🔀 Pioche mélangée secrètement ({len(self.pioche)} cartes)")
+        print(f"   Seed de mélange : {seed} (gardé secret)")
+
+        # Les dossiers seront resynchronisés avant le prochain affichage
+        self._a_synchroniser = True
+
+    def melanger_et_distribuer(
+        self, nombre_cartes: int = 7, seed: Optional[int] = None
+    ) -> bool:
+        """
+        Mélange et distribue la main initiale en une seule passe.
+
+        Le paquet est entièrement mélangé (un mélange partiel laisserait
+        la pioche quasiment dans l'ordre d'origine, donc prévisible),
+        puis les nombre_cartes premières cartes forment la main ; une
+        seule synchronisation des dossiers au lieu d'une par étape.
 
-        # Mélanger avec la graine
-        random.seed(seed)
-        random.shuffle(self.pioche)
+        Args:
+            nombre_cartes: Nombre de cartes à distribuer
+            seed: Graine pour le mélange (optionnel, pour reproductibilité)
+
+        Returns:
+            bool: True si la distribution s'est bien passée
+        """
+        if len(self.toutes_cartes) < nombre_cartes:
+            print(
+                f"❌ Pas assez de cartes dans la pioche pour distribuer {nombre_cartes} cartes"
+            )
+            return False
+
+        if seed is None:
+            seed = random.randint(1, 1000000)
+
+        self.seed_melange = seed
+
+        numeros = array("B", (carte.numero for carte in self.toutes_cartes))
+        _melanger_lemire(numeros, random.Random(seed))
+
+        self.main_joueur = array("B", sorted(numeros[:nombre_cartes]))
+        self.pioche = numeros[nombre_cartes:]
+        self.defausse = array("B")
 
         print(f"🔀 Pioche mélangée secrètement ({len(self.pioche)} cartes)")
         print(f"   Seed de mélange : {seed} (gardé secret)")
+        print(f"🎴 Main initiale distribuée : {nombre_cartes} cartes")
 
-        # Organiser les cartes dans les dossiers
-        self.organiser_cartes_dans_dossiers()
+        # Les dossiers seront resynchronisés avant le prochain affichage
+        self._a_synchroniser = True
+
+        return True
 
     def distribuer_main_initiale(self, nombre_cartes: int = 7) -> bool:
         """
@@ -197,19 +406,15 @@ class GestionnaireCartes:
             )
             return False
 
-        self.main_joueur = []
-
-        for _ in range(nombre_cartes):
-            carte = self.pioche.pop(0)  # Piocher du dessus
-            self.main_joueur.append(carte)
-
-        # Trier la main par numéro pour faciliter la visualisation
-        self.main_joueur.sort(key=lambda c: c.numero)
+        # Prendre les cartes du dessus, triées par numéro pour faciliter
+        # la visualisation
+        self.main_joueur = array("B", sorted(self.pioche[:nombre_cartes]))
+        del self.pioche[:nombre_cartes]
 
         print(f"🎴 Main initiale distribuée : {nombre_cartes} cartes")
 
-        # Réorganiser les cartes dans les dossiers
-        self.organiser_cartes_dans_dossiers()
+        # Les dossiers seront resynchronisés avant le prochain affichage
+        self._a_synchroniser = True
 
         return True
 
@@ -219,25 +424,30 @@ class GestionnaireCartes:
             print("🎴 Main vide")
             return
 
-        print(f"\n🎴 Main du joueur ({len(self.main_joueur)} cartes):")
-        for i, carte in enumerate(self.main_joueur):
-            print(f"  {i + 1}. {carte}")
+        # Construire tout l'affichage puis écrire en une seule fois :
+        # une entrée noyau par rafraîchissement au lieu d'une par carte
+        lignes = [f"\n🎴 Main du joueur ({len(self.main_joueur)} cartes):"]
+        lignes.extend(
+            f"  {i + 1}. {self.trouver_carte(numero)}"
+            for i, numero in enumerate(self.main_joueur)
+        )
+        sys.stdout.write("\n".join(lignes) + "\n")
 
     def afficher_statuts(self) -> None:
         """Affiche l'état général du jeu"""
-        print(f"\n📊 État du jeu:")
-        print(
-            f"  📚 Pioche: {len(self.pioche)} cartes (dossier: {self.dossier_pioche})"
-        )
-        print(
-            f"  🎴 Main: {len(self.main_joueur)} cartes (dossier: {self.dossier_main})"
-        )
-        print(
-            f"  🗑️  Défausse: {len(self.defausse)} cartes (dossier: {self.dossier_defausse})"
-        )
+        lignes = [
+            "\n📊 État du jeu:",
+            f"  📚 Pioche: {len(self.pioche)} cartes (dossier: {self.dossier_pioche})",
+            f"  🎴 Main: {len(self.main_joueur)} cartes (dossier: {self.dossier_main})",
+            f"  🗑️  Défausse: {len(self.defausse)} cartes (dossier: {self.dossier_defausse})",
+        ]
 
         if self.defausse:
-            print(f"     Dessus de la défausse: {self.defausse[-1]}")
+            lignes.append(
+                f"     Dessus de la défausse: {self.trouver_carte(self.defausse[-1])}"
+            )
+
+        sys.stdout.write("\n".join(lignes) + "\n")
 
     def piocher_carte(self) -> bool:
         """
@@ -250,16 +460,15 @@ class GestionnaireCartes:
             print("❌ La pioche est vide !")
             return False
 
-        carte_piochee = self.pioche.pop(0)  # Prendre le dessus de la pioche
-        self.main_joueur.append(carte_piochee)
+        numero_pioche = self.pioche.pop(0)  # Prendre le dessus de la pioche
 
-        # Trier la main
-        self.main_joueur.sort(key=lambda c: c.numero)
+        # Insérer directement à la bonne position : la main reste triée
+        insort(self.main_joueur, numero_pioche)
 
-        print(f"✅ Vous avez pioché : {carte_piochee}")
+        print(f"✅ Vous avez pioché : {self.trouver_carte(numero_pioche)}")
 
-        # Réorganiser les cartes dans les dossiers
-        self.organiser_cartes_dans_dossiers()
+        # Les dossiers seront resynchronisés avant le prochain affichage
+        self._a_synchroniser = True
 
         return True
 
@@ -281,13 +490,13 @@ class GestionnaireCartes:
             print(f"❌ Index invalide. Choisissez entre 1 et {len(self.main_joueur)}")
             return False
 
-        carte_defaussee = self.main_joueur.pop(index_carte - 1)  # Convertir en 0-based
-        self.defausse.append(carte_defaussee)  # Ajouter au dessus de la défausse
+        numero_defausse = self.main_joueur.pop(index_carte - 1)  # Convertir en 0-based
+        self.defausse.append(numero_defausse)  # Ajouter au dessus de la défausse
 
-        print(f"🗑️  Vous avez défaussé : {carte_defaussee}")
+        print(f"🗑️  Vous avez défaussé : {self.trouver_carte(numero_defausse)}")
 
-        # Réorganiser les cartes dans les dossiers
-        self.organiser_cartes_dans_dossiers()
+        # Les dossiers seront resynchronisés avant le prochain affichage
+        self._a_synchroniser = True
 
         return True
 
@@ -304,13 +513,25 @@ class GestionnaireCartes:
         try:
             etat = {
                 "seed_melange": self.seed_melange,
-                "pioche": [carte.numero for carte in self.pioche],
-                "main_joueur": [carte.numero for carte in self.main_joueur],
-                "defausse": [carte.numero for carte in self.defausse],
+                "pioche": self.pioche.tolist(),
+                "main_joueur": self.main_joueur.tolist(),
+                "defausse": self.defausse.tolist(),
             }
 
-            with open(nom_fichier, "w", encoding="utf-8") as f:
-                json.dump(etat, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                contenu = orjson.dumps(etat, option=orjson.OPT_INDENT_2)
+            else:
+                contenu = json.dumps(etat, indent=2, ensure_ascii=False).encode("utf-8")
+
+            # Écrire dans un fichier temporaire puis renommer : le
+            # renommage est atomique, une coupure en pleine écriture ne
+            # corrompt jamais la sauvegarde existante
+            chemin_temporaire = nom_fichier + ".tmp"
+            with open(chemin_temporaire, "wb") as f:
+                f.write(contenu)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(chemin_temporaire, nom_fichier)
 
             print(f"💾 Partie sauvegardée dans '{nom_fichier}'")
             return True
@@ -334,20 +555,24 @@ class GestionnaireCartes:
             return False
 
         try:
-            with open(nom_fichier, "r", encoding="utf-8") as f:
-                etat = json.load(f)
+            if orjson is not None:
+                with open(nom_fichier, "rb") as f:
+                    etat = orjson.loads(f.read())
+            else:
+                with open(nom_fichier, "r", encoding="utf-8") as f:
+                    etat = json.load(f)
 
             # Reconstruire les listes de cartes
             self.seed_melange = etat.get("seed_melange")
 
-            self.pioche = [self.trouver_carte(num) for num in etat["pioche"]]
-            self.main_joueur = [self.trouver_carte(num) for num in etat["main_joueur"]]
-            self.defausse = [self.trouver_carte(num) for num in etat["defausse"]]
+            self.pioche = array("B", etat["pioche"])
+            self.main_joueur = array("B", etat["main_joueur"])
+            self.defausse = array("B", etat["defausse"])
 
             print(f"📂 Partie chargée depuis '{nom_fichier}'")
 
-            # Réorganiser les cartes dans les dossiers
-            self.organiser_cartes_dans_dossiers()
+            # Les dossiers seront resynchronisés avant le prochain affichage
+            self._a_synchroniser = True
 
             return True
 
@@ -357,9 +582,9 @@ class GestionnaireCartes:
 
     def trouver_carte(self, numero: int) -> Carte:
         """Trouve une carte par son numéro"""
-        for carte in self.toutes_cartes:
-            if carte.numero == numero:
-                return carte
+        carte = self._carte_par_numero.get(numero)
+        if carte is not None:
+            return carte
         # Si pas trouvée, créer une carte temporaire
         return Carte(numero, f"{numero}.png")
 
@@ -372,6 +597,10 @@ def menu_principal(gestionnaire: GestionnaireCartes) -> None:
         print("🎴 GESTIONNAIRE DE CARTES VICTORY & VALOUR")
         print("=" * 50)
 
+        # Une seule synchronisation disque, même si plusieurs actions
+        # ont modifié l'état depuis le dernier affichage
+        gestionnaire._synchroniser_si_necessaire()
+
         gestionnaire.afficher_statuts()
         gestionnaire.afficher_main()
 
@@ -417,10 +646,7 @@ def menu_principal(gestionnaire: GestionnaireCartes) -> None:
 
             elif choix == "5":
                 print("🔄 Nouveau mélange...")
-                gestionnaire.melanger_pioche()
-                gestionnaire.main_joueur = []
-                gestionnaire.defausse = []
-                gestionnaire.distribuer_main_initiale()
+                gestionnaire.melanger_et_distribuer()
 
             elif choix == "6":
                 print("🗂️  Réorganisation des cartes...")
@@ -448,10 +674,8 @@ def main():
     if not gestionnaire.charger_cartes():
         return
 
-    # Mélanger et distribuer
-    gestionnaire.melanger_pioche()
-
-    if not gestionnaire.distribuer_main_initiale():
+    # Mélanger et distribuer en une seule passe
+    if not gestionnaire.melanger_et_distribuer():
         return
 
     # Lancer l'interface